@@ -8,10 +8,27 @@ import astropy.units as U
 from astropy import wcs
 from astropy.coordinates import ICRS, SpectralCoord
 import warnings
+from functools import partial
 from astropy.coordinates import frame_transform_graph
 
 HIfreq = 1.420405751e9 * U.Hz
+# radio doppler equivalencies are used for every velocity <-> frequency conversion of
+# the channels, build them only once:
+_HI_DOPPLER = U.doppler_radio(HIfreq)
+_to_velocity = partial(U.Quantity.to, unit=U.m / U.s, equivalencies=_HI_DOPPLER)
+_to_frequency = partial(U.Quantity.to, unit=U.Hz, equivalencies=_HI_DOPPLER)
 _supported_specsys = frame_transform_graph.get_names()
+# formatting units as FITS strings is relatively slow, do it once:
+_FITS_CUNIT_FREQ = U.Hz.to_string(format="fits")
+_FITS_CUNIT_VRAD = (U.m / U.s).to_string(format="fits")
+# lower precision underflows typical surface brightnesses, higher has no FITS BITPIX:
+_SUPPORTED_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+_DEPOSIT_CHUNK_SIZE = 1024  # pixels per write in DataCube._deposit
+_CHANNEL_MODE_DEPRECATION = (
+    "Changing the channel mode is deprecated. You can access channels in desired units"
+    " with `DataCube.frequency_channel_edges`, `DataCube.frequency_channel_mids`,"
+    " `DataCube.velocity_channel_edges` and `DataCube.velocity_channel_mids`."
+)
 
 
 def _validate_specsys(specsys):
@@ -33,6 +50,84 @@ def _validate_specsys(specsys):
     return specsys
 
 
+def _hi_spectral_coord(spectral_values):
+    """
+    Wrap spectral values as HI line coordinates with the radio doppler convention.
+
+    Parameters
+    ----------
+    spectral_values : ~astropy.units.Quantity
+        :class:`~astropy.units.Quantity` with dimensions of frequency or velocity.
+
+    Returns
+    -------
+    out : ~astropy.coordinates.SpectralCoord
+        :class:`~astropy.coordinates.SpectralCoord` with the radio doppler convention
+        and the HI rest frequency, sharing memory with the input where possible.
+    """
+    return SpectralCoord(
+        spectral_values, doppler_convention="radio", doppler_rest=HIfreq, copy=False
+    )
+
+
+def _make_arcsec2_to_pix(px_size):
+    """
+    Create the equivalency between surface brightness per pixel and per square arcsec.
+
+    The conversion functions capture only the pixel area, not the
+    :class:`~martini.datacube.DataCube`, so they don't keep a data cube (and its
+    array) alive.
+
+    Parameters
+    ----------
+    px_size : ~astropy.units.Quantity
+        :class:`~astropy.units.Quantity`, with dimensions of angle.
+        Angular scale of one pixel.
+
+    Returns
+    -------
+    out : tuple
+        An :mod:`astropy.units` equivalency between ``U.Jy * U.pix**-2`` and
+        ``U.Jy * U.arcsec**-2``.
+    """
+    px_area = px_size.to_value(U.arcsec) ** 2
+    return (
+        U.Jy * U.pix**-2,
+        U.Jy * U.arcsec**-2,
+        lambda x: x / px_area,
+        lambda x: x * px_area,
+    )
+
+
+def _linear_pix2world(pix, crpix, crval, cdelt):
+    """
+    Evaluate a linear World Coordinate System (WCS) axis at pixel positions.
+
+    Parameters
+    ----------
+    pix : ~numpy.typing.ArrayLike
+        Pixel coordinates at which to evaluate the axis.
+
+    crpix : float
+        Pixel coordinate of the reference point, using the same origin as ``pix``.
+
+    crval : float
+        World coordinate value at the reference point.
+
+    cdelt : float
+        World coordinate increment per pixel.
+
+    Returns
+    -------
+    out : ~numpy.ndarray
+        World coordinate values at the pixel positions.
+    """
+    world = np.asarray(pix, dtype=np.float64) - crpix
+    world *= cdelt  # in-place to avoid temporaries
+    world += crval
+    return world
+
+
 class DataCube(object):
     """
     Handles creation and management of the data cube itself.
@@ -97,6 +192,12 @@ class DataCube(object):
         use :meth:`astropy.coordinates.frame_transform_graph.get_names`.
         (Default: ``"icrs"``)
 
+    dtype : type, optional
+        Data type of the data cube array, either ``numpy.float32`` or
+        ``numpy.float64``. Single precision (``numpy.float32``) halves the memory
+        footprint of the cube (and the memory traffic of operations on it, such as beam
+        convolution) at the cost of precision. (Default: ``numpy.float64``)
+
     velocity_centre : ~astropy.units.Quantity, deprecated
         Deprecated, use spectral centre instead.
 
@@ -129,6 +230,7 @@ class DataCube(object):
         stokes_axis=False,
         coordinate_frame=ICRS(),
         specsys="icrs",
+        dtype=np.float64,
         velocity_centre=None,  # deprecated
     ):
         if velocity_centre is not None:
@@ -141,18 +243,15 @@ class DataCube(object):
         self.stokes_axis = stokes_axis
         self.coordinate_frame = coordinate_frame
         self.specsys = _validate_specsys(specsys)
-        datacube_unit = U.Jy * U.pix**-2
-        self._array = np.zeros((n_px_x, n_px_y, n_channels)) * datacube_unit
+        if np.dtype(dtype) not in _SUPPORTED_DTYPES:
+            raise ValueError("DataCube dtype must be numpy.float32 or numpy.float64.")
+        self._unit = U.Jy * U.pix**-2
+        self._array = np.zeros((n_px_x, n_px_y, n_channels), dtype=dtype)
         if self.stokes_axis:
             self._array = self._array[..., np.newaxis]
         self.n_px_x, self.n_px_y, self.n_channels = n_px_x, n_px_y, n_channels
         self.px_size = px_size
-        self.arcsec2_to_pix = (
-            U.Jy * U.pix**-2,
-            U.Jy * U.arcsec**-2,
-            lambda x: x / self.px_size.to_value(U.arcsec) ** 2,
-            lambda x: x * self.px_size.to_value(U.arcsec) ** 2,
-        )
+        self.arcsec2_to_pix = _make_arcsec2_to_pix(self.px_size)
         if U.get_physical_type(channel_width) == "frequency":
             self._freq_channel_mode = True
         elif U.get_physical_type(channel_width) == "velocity":
@@ -179,32 +278,18 @@ class DataCube(object):
         """
         Deprecated - issues a warning then does nothing.
         """
-        warnings.warn(
-            DeprecationWarning(
-                "Changing the channel mode is deprecated. You can access channels in"
-                " deisred units with `DataCube.frequency_channel_edges`,"
-                " `DataCube.frequency_channel_mids`, `DataCube.velocity_channel_edges`"
-                " and `DataCube.velocity_channel_mids`."
-            )
-        )
+        warnings.warn(DeprecationWarning(_CHANNEL_MODE_DEPRECATION))
         pass
 
     def freq_channels(self):
         """
         Deprecated - issues a warning then does nothing.
         """
-        warnings.warn(
-            DeprecationWarning(
-                "Changing the channel mode is deprecated. You can access channels in"
-                " deisred units with `DataCube.frequency_channel_edges`,"
-                " `DataCube.frequency_channel_mids`, `DataCube.velocity_channel_edges`"
-                " and `DataCube.velocity_channel_mids`."
-            )
-        )
+        warnings.warn(DeprecationWarning(_CHANNEL_MODE_DEPRECATION))
         pass
 
     @classmethod
-    def from_wcs(cls, input_wcs, specsys=None):
+    def from_wcs(cls, input_wcs, specsys=None, dtype=np.float64):
         """
         Create a DataCube from a World Coordinate System (WCS), for instance one created
         from a FITS header.
@@ -230,6 +315,10 @@ class DataCube(object):
             ``"icrs"``, ``"hcrs"``, ``"lsrk"``, ``"lsrd"``, ``"lsr"``.
             (Default: ``"icrs"``)
 
+        dtype : type, optional
+            Data type of the data cube array, either ``numpy.float32`` or
+            ``numpy.float64``. (Default: ``numpy.float64``)
+
         See Also
         --------
         martini.datacube.DataCube
@@ -274,6 +363,7 @@ class DataCube(object):
             stokes_axis=None,
             coordinate_frame=None,
             specsys=None,
+            dtype=dtype,
         )
         for axis_type in input_wcs.get_axis_types():
             if axis_type["coordinate_type"] == "stokes":
@@ -364,6 +454,30 @@ class DataCube(object):
         )
         return datacube
 
+    @property
+    def array(self):
+        """
+        The data cube array with its units attached.
+
+        The array is stored internally as a plain :class:`~numpy.ndarray` with its units
+        tracked separately, such that arithmetic on it avoids the overhead of
+        :class:`~astropy.units.Quantity` operations. This property provides a view with
+        units attached (no copy is made).
+
+        The units of the view are those of the data cube when the property is accessed.
+        Some steps (e.g. :meth:`~martini.martini.Martini.insert_source_in_cube` and
+        :meth:`~martini.martini.Martini.convolve_beam`) rescale the array in place to
+        new units, after which the values of a previously obtained view no longer match
+        its units. Access the property again after such a step, or take a copy
+        (``datacube.array.copy()``) to keep the values at that point.
+
+        Returns
+        -------
+        out : ~astropy.units.Quantity
+            :class:`~astropy.units.Quantity` view of the data cube array.
+        """
+        return self._array << self._unit
+
     @property
     def units(self):
         """
@@ -390,51 +504,91 @@ class DataCube(object):
         """
         if self._wcs is None:
             hdr = wcs.utils.celestial_frame_to_wcs(self.coordinate_frame).to_header()
-            hdr.update(dict(WCSAXES=3))  # add spectral axis
+            # add spectral (and Stokes) axes up front, extending the WCS afterwards with
+            # wcs.utils.add_stokes_axis_to_wcs would need a deep copy:
+            n_stokes = 1 if self.stokes_axis else 0
+            hdr.update(dict(WCSAXES=3 + n_stokes))
             hdr.update(
                 dict(NAXIS1=self.n_px_x, NAXIS2=self.n_px_y, NAXIS3=self.n_channels)
             )
+            if self.stokes_axis:
+                hdr.update(dict(NAXIS4=1, CNAME4="STOKES"))
             hdr.update(dict(RESTFRQ=HIfreq.to_value(U.Hz)))
             self._wcs = wcs.WCS(hdr)
             self._wcs.wcs.ctype = [
                 self._wcs.wcs.ctype[0],
                 self._wcs.wcs.ctype[1],
                 "FREQ" if self._freq_channel_mode else "VRAD",
-            ]
+            ] + ["STOKES"] * n_stokes
             self._wcs.wcs.specsys = self.specsys
+            # look up units once, each access to wcs.cunit parses the unit string:
+            ra_unit, dec_unit = self._wcs.wcs.cunit[0], self._wcs.wcs.cunit[1]
+            spec_unit = U.Hz if self._freq_channel_mode else U.m / U.s
             self._wcs.wcs.cunit = [
-                self._wcs.wcs.cunit[0],
-                self._wcs.wcs.cunit[1],
-                (
-                    U.Hz.to_string(format="fits")
-                    if self._freq_channel_mode
-                    else (U.m / U.s).to_string(format="fits")
-                ),
-            ]
+                ra_unit,
+                dec_unit,
+                _FITS_CUNIT_FREQ if self._freq_channel_mode else _FITS_CUNIT_VRAD,
+            ] + [""] * n_stokes
             self._wcs.wcs.crpix = [
                 self.n_px_x / 2.0 + 0.5 + self.padx,
                 self.n_px_y / 2.0 + 0.5 + self.pady,
                 self.n_channels / 2.0 + 0.5,
-            ]
+            ] + [0.0] * n_stokes
             spec_step_sign = 1 if self._freq_channel_mode else -1
             self._wcs.wcs.cdelt = [
-                -self.px_size.to_value(self._wcs.wcs.cunit[0]),
-                self.px_size.to_value(self._wcs.wcs.cunit[1]),
-                spec_step_sign
-                * np.abs(self.channel_width.to_value(self._wcs.wcs.cunit[2])),
-            ]
+                -self.px_size.to_value(ra_unit),
+                self.px_size.to_value(dec_unit),
+                spec_step_sign * np.abs(self.channel_width.to_value(spec_unit)),
+            ] + [1.0] * n_stokes
             self._wcs.wcs.crval = [
-                self.ra.to_value(self._wcs.wcs.cunit[0]),
-                self.dec.to_value(self._wcs.wcs.cunit[1]),
-                self.spectral_centre.to_value(self._wcs.wcs.cunit[2]),
-            ]
-            if self.stokes_axis:
-                self._wcs = wcs.utils.add_stokes_axis_to_wcs(
-                    self._wcs, self._wcs.wcs.naxis
-                )
-                self._wcs.pixel_shape = (self.n_px_x, self.n_px_y, self.n_channels, 1)
+                self.ra.to_value(ra_unit),
+                self.dec.to_value(dec_unit),
+                self.spectral_centre.to_value(spec_unit),
+            ] + [0.0] * n_stokes
+            # populate derived attributes (e.g. wcs.spec), as add_stokes_axis_to_wcs did:
+            self._wcs.wcs.set()
         return self._wcs
 
+    def _spectral_pix2world(self, pix, use_full_wcs=False):
+        """
+        Convert pixel coordinates along the spectral axis to spectral coordinates.
+
+        Spectral axes without a non-linear algorithm code (e.g. ``"FREQ"`` or
+        ``"VRAD"``, as used for cubes initialized by MARTINI) are linear, so the
+        conversion is evaluated directly as ``crval + (pix - crpix) * cdelt`` rather
+        than through a call to WCSLIB. Non-linear axes (e.g. ``"VOPT-F2W"``, possible for
+        cubes created with :meth:`~martini.datacube.DataCube.from_wcs`) always use the
+        full WCS transformation.
+
+        Parameters
+        ----------
+        pix : ~numpy.typing.ArrayLike
+            Pixel coordinates along the spectral axis, indexed from ``0``.
+
+        use_full_wcs : bool, optional
+            If ``True``, always use the full WCS transformation. (Default: ``False``)
+
+        Returns
+        -------
+        out : ~astropy.units.Quantity
+            1D :class:`~astropy.units.Quantity` with dimensions of frequency or velocity
+            containing the spectral coordinates (also for a single pixel).
+        """
+        self.wcs.wcs.set()  # ensures units normalized and PC matrix available
+        spec = self.wcs.wcs.spec
+        spec_unit = self.wcs.wcs.cunit[spec]
+        if use_full_wcs or len(self.wcs.wcs.ctype[spec]) > 4:
+            # all_pix2world on a single axis returns a list, squeeze to 1D:
+            world = np.squeeze(self.wcs.sub(("spectral",)).all_pix2world(pix, 0))
+        else:
+            world = _linear_pix2world(
+                pix,
+                self.wcs.wcs.crpix[spec] - 1,  # FITS crpix counts from 1
+                self.wcs.wcs.crval[spec],
+                self.wcs.wcs.get_cdelt()[spec] * self.wcs.wcs.get_pc()[spec, spec],
+            )
+        return np.atleast_1d(world) << spec_unit
+
     @property
     def channel_mids(self):
         """
@@ -447,17 +601,7 @@ class DataCube(object):
             containing the channel centres.
         """
         if self._channel_mids is None:
-            self._channel_mids = SpectralCoord(
-                (
-                    self.wcs.sub(("spectral",)).all_pix2world(
-                        np.arange(self.n_channels),
-                        0,
-                    )
-                    * self.units[2]
-                ).squeeze(),
-                doppler_convention="radio",
-                doppler_rest=HIfreq,
-            )
+            self._init_channels()
         return self._channel_mids
 
     @property
@@ -472,19 +616,23 @@ class DataCube(object):
             containing the channel edges.
         """
         if self._channel_edges is None:
-            self._channel_edges = SpectralCoord(
-                (
-                    self.wcs.sub(("spectral",)).all_pix2world(
-                        np.arange(self.n_channels + 1) - 0.5,
-                        0,
-                    )
-                    * self.units[2]
-                ).squeeze(),
-                doppler_convention="radio",
-                doppler_rest=HIfreq,
-            )
+            self._init_channels()
         return self._channel_edges
 
+    def _init_channels(self):
+        """
+        Compute and cache the channel edges and centres.
+
+        The spectral axis is evaluated once, on a grid of half-pixel steps: the even
+        elements are the channel edges and the odd elements the channel centres.
+        """
+        channels = _hi_spectral_coord(
+            self._spectral_pix2world(np.arange(2 * self.n_channels + 1) / 2 - 0.5)
+        )
+        self._channel_edges = channels[::2]
+        self._channel_mids = channels[1::2]
+        return
+
     @property
     def velocity_channel_mids(self):
         """
@@ -496,7 +644,7 @@ class DataCube(object):
             :class:`~astropy.units.Quantity` with dimensions of velocity containing the
             channel centres.
         """
-        return self.channel_mids.to(U.m / U.s)
+        return _hi_spectral_coord(_to_velocity(self.channel_mids.view(U.Quantity)))
 
     @property
     def velocity_channel_edges(self):
@@ -509,7 +657,7 @@ class DataCube(object):
             :class:`~astropy.units.Quantity` with dimensions of velocity containing the
             channel edges.
         """
-        return self.channel_edges.to(U.m / U.s)
+        return _hi_spectral_coord(_to_velocity(self.channel_edges.view(U.Quantity)))
 
     @property
     def frequency_channel_mids(self):
@@ -522,7 +670,7 @@ class DataCube(object):
             :class:`~astropy.units.Quantity` with dimensions of frequency containing the
             channel centres.
         """
-        return self.channel_mids.to(U.Hz)
+        return _hi_spectral_coord(_to_frequency(self.channel_mids.view(U.Quantity)))
 
     @property
     def frequency_channel_edges(self):
@@ -535,7 +683,7 @@ class DataCube(object):
             :class:`~astropy.units.Quantity` with dimensions of frequency containing the
             channel edges.
         """
-        return self.channel_edges.to(U.Hz)
+        return _hi_spectral_coord(_to_frequency(self.channel_edges.view(U.Quantity)))
 
     @property
     def _stokes_index(self):
@@ -575,46 +723,105 @@ class DataCube(object):
         """
         An iterator over the spatial 'slices' of the cube.
 
+        The cube is stored with the spectral axis varying fastest in memory (after the
+        Stokes' axis, if present, which has length ``1``), so that the spectrum in each
+        spatial pixel is contiguous. The spatial slices are therefore strided views.
+
         Returns
         -------
         out : iter
             The iterator over the spatial 'slices' of the cube.
         """
-        if self.stokes_axis:
-            return iter(
-                self._array.squeeze(self._stokes_index).transpose(
-                    (self.wcs.wcs.spec, self.wcs.wcs.lng, self.wcs.wcs.lat)
-                )
-            )
-        else:
-            return iter(
-                self._array.transpose(
-                    (self.wcs.wcs.spec, self.wcs.wcs.lng, self.wcs.wcs.lat)
-                )
-            )
+        cube = self.array[..., 0] if self.stokes_axis else self.array
+        return iter(np.moveaxis(cube, 2, 0))
 
     @property
     def spectra(self):
         """
-        An iterator over the spectra (one in each spatial pixel).
+        Deprecated - an iterator over the spectra (one in each spatial pixel).
+
+        Use :attr:`~martini.datacube.DataCube.spectra_batch` instead, which allows
+        operations on all spectra to be vectorized rather than looping over pixels.
 
         Returns
         -------
         out : iter
             The iterator over the spectra making up the cube.
         """
-        if self.stokes_axis:
-            return iter(
-                self._array.squeeze(self._stokes_index)
-                .transpose((self.wcs.wcs.lng, self.wcs.wcs.lat, self.wcs.wcs.spec))
-                .reshape(self.n_px_x * self.n_px_y, self.n_channels)
+        warnings.warn(
+            DeprecationWarning(
+                "`DataCube.spectra` is deprecated, use `DataCube.spectra_batch` instead."
             )
-        else:
-            return iter(
-                self._array.transpose(
-                    (self.wcs.wcs.lng, self.wcs.wcs.lat, self.wcs.wcs.spec)
-                ).reshape(self.n_px_x * self.n_px_y, self.n_channels)
+        )
+        return iter(self.spectra_batch)
+
+    @property
+    def spectra_batch(self):
+        """
+        The spectra (one in each spatial pixel) as a 2D array.
+
+        The first axis runs over spatial pixels and the second over channels. This is a
+        view into the data cube (no copy is made), so operations on the spectra can be
+        vectorized over the pixel axis instead of looping over pixels, for example
+        ``scipy.signal.oaconvolve(datacube.spectra_batch, lsf[np.newaxis], axes=-1)``
+        to convolve every spectrum with a line spread function ``lsf``.
+
+        Returns
+        -------
+        out : ~astropy.units.Quantity
+            :class:`~astropy.units.Quantity` with shape ``(n_px_x * n_px_y, n_channels)``
+            containing the spectra making up the cube.
+        """
+        cube = self.array[..., 0] if self.stokes_axis else self.array
+        return cube.reshape(self.n_px_x * self.n_px_y, self.n_channels)
+
+    def _deposit(self, pixel_spectra):
+        """
+        Write the spectra for a batch of spatial pixels into the data cube array.
+
+        The spectra are stripped of their units (converting to the units of the data
+        cube) and written into the underlying :class:`~numpy.ndarray` in chunks of
+        ``_DEPOSIT_CHUNK_SIZE`` pixels, one indexing operation per chunk, rather than one
+        :class:`~astropy.units.Quantity` assignment per pixel. Working in bounded chunks
+        keeps the temporary memory needed small compared to the data cube.
+
+        Parameters
+        ----------
+        pixel_spectra : list
+            A list containing 2-tuples. Each 2-tuple contains the indices (i, j) of a
+            pixel and a 1D :class:`~astropy.units.Quantity` containing the spectrum to
+            place in that pixel, whose length must match the number of channels.
+        """
+        cube = self._array[..., 0] if self.stokes_axis else self._array
+        for start in range(0, len(pixel_spectra), _DEPOSIT_CHUNK_SIZE):
+            chunk = pixel_spectra[start : start + _DEPOSIT_CHUNK_SIZE]
+            ij_pxs = np.array([ij_px for ij_px, _ in chunk])
+            cube[ij_pxs[:, 0], ij_pxs[:, 1]] = np.stack(
+                [spectrum.to_value(self._unit) for _, spectrum in chunk]
             )
+        return
+
+    def _convert_unit(self, unit, equivalencies=None):
+        """
+        Convert the data cube array to new (linearly related) units in place.
+
+        The array is rescaled in place, so no copy is made and its ``dtype`` is
+        preserved. Views previously obtained from
+        :attr:`~martini.datacube.DataCube.array` see the rescaled values but keep their
+        old units, so they are invalid after the conversion.
+
+        Parameters
+        ----------
+        unit : ~astropy.units.UnitBase
+            The units to convert to.
+
+        equivalencies : list, optional
+            Equivalencies needed for the conversion, passed to
+            :meth:`~astropy.units.UnitBase.to`. (Default: ``None``)
+        """
+        self._array *= self._unit.to(unit, equivalencies=equivalencies)
+        self._unit = unit
+        return
 
     def add_pad(self, pad):
         """
@@ -638,15 +845,11 @@ class DataCube(object):
 
         if self.padx > 0 or self.pady > 0:
             raise RuntimeError("Tried to add padding to already padded datacube array.")
-        tmp = self._array
-        shape = (self.n_px_x + pad[0] * 2, self.n_px_y + pad[1] * 2, self.n_channels)
-        if self.stokes_axis:
-            shape = shape + (1,)
-        self._array = np.zeros(shape)
-        self._array = self._array * tmp.unit
-        xregion = np.s_[pad[0] : -pad[0]] if pad[0] > 0 else np.s_[:]
-        yregion = np.s_[pad[1] : -pad[1]] if pad[1] > 0 else np.s_[:]
-        self._array[xregion, yregion, ...] = tmp
+        # single allocation, border filled with zeros:
+        self._array = np.pad(
+            self._array,
+            ((pad[0], pad[0]), (pad[1], pad[1])) + ((0, 0),) * (self._array.ndim - 2),
+        )
         extend_crpix = [pad[0], pad[1], 0]
         if self.stokes_axis:
             extend_crpix.append(0)
@@ -669,6 +872,10 @@ class DataCube(object):
         if (self.padx == 0) and (self.pady == 0):
             return
         self._array = self._array[self.padx : -self.padx, self.pady : -self.pady, ...]
+        if not self._array.flags["C_CONTIGUOUS"]:
+            # copy once here rather than in every consumer of the array that needs it to
+            # be contiguous (e.g. spectra_batch, output writers)
+            self._array = np.ascontiguousarray(self._array)
         retract_crpix = [self.padx, self.pady, 0]
         if self.stokes_axis:
             retract_crpix.append(0)
@@ -688,22 +895,12 @@ class DataCube(object):
         out : ~martini.datacube.DataCube
             Copy of the :class:`~martini.datacube.DataCube` object.
         """
-        copy = DataCube(
-            self.n_px_x,
-            self.n_px_y,
-            self.n_channels,
-            self.px_size,
-            self.channel_width,
-            self.spectral_centre,
-            self.ra,
-            self.dec,
-        )
-        copy.padx, copy.pady = self.padx, self.pady
-        copy._wcs = self.wcs.copy()
-        copy._freq_channel_mode = self._freq_channel_mode
-        copy._channel_edges = self._channel_edges
-        copy._channel_mids = self._channel_mids
+        # bypass __init__, everything it sets up is copied from this instance
+        copy = type(self).__new__(type(self))
+        copy.__dict__.update(self.__dict__)
+        copy._wcs = None if self._wcs is None else self._wcs.deepcopy()
         copy._array = self._array.copy()
+        copy.arcsec2_to_pix = _make_arcsec2_to_pix(self.px_size)
         return copy
 
     def save_state(self, filename, overwrite=False):
@@ -730,9 +927,8 @@ class DataCube(object):
 
         mode = "w" if overwrite else "w-"
         with h5py.File(filename, mode=mode) as f:
-            array_unit = self._array.unit
-            f["_array"] = self._array.to_value(array_unit)
-            f["_array"].attrs["datacube_unit"] = str(array_unit)
+            f["_array"] = self._array
+            f["_array"].attrs["datacube_unit"] = str(self._unit)
             f["_array"].attrs["n_px_x"] = self.n_px_x
             f["_array"].attrs["n_px_y"] = self.n_px_y
             f["_array"].attrs["n_channels"] = self.n_channels
@@ -814,7 +1010,8 @@ class DataCube(object):
                 stokes_axis=stokes_axis,
             )
             D.add_pad((f["_array"].attrs["padx"], f["_array"].attrs["pady"]))
-            D._array = f["_array"] * U.Unit(f["_array"].attrs["datacube_unit"])
+            D._array = f["_array"][()]
+            D._unit = U.Unit(f["_array"].attrs["datacube_unit"])
             # must be after add_pad:
             D._wcs = wcs.WCS(f["_array"].attrs["wcs_hdr"])
         return D
@@ -828,7 +1025,7 @@ class DataCube(object):
         out : str
             Text representation of the :attr:`~martini.datacube.DataCube._array` contents.
         """
-        return self._array.__repr__()
+        return self.array.__repr__()
 
 
 class _GlobalProfileDataCube(DataCube):
@@ -855,6 +1052,10 @@ class _GlobalProfileDataCube(DataCube):
         (WCS) associated with the data cube, selected from the list ``"gcrs"``,
         ``"icrs"``, ``"hcrs"``, ``"lsrk"``, ``"lsrd"``, ``"lsr"``. (Default: ``"icrs"``)
 
+    dtype : type, optional
+        Data type of the data cube array, either ``numpy.float32`` or
+        ``numpy.float64``. (Default: ``numpy.float64``)
+
     velocity_centre : ~astropy.units.Quantity, deprecated
         Deprecated, use spectral centre instead.
     """
@@ -865,6 +1066,7 @@ class _GlobalProfileDataCube(DataCube):
         channel_width=4.0 * U.km * U.s**-1,
         spectral_centre=0.0 * U.km * U.s**-1,
         specsys="icrs",
+        dtype=np.float64,
         velocity_centre=None,  # deprecated
     ):
         super().__init__(
@@ -879,6 +1081,7 @@ class _GlobalProfileDataCube(DataCube):
             stokes_axis=False,
             coordinate_frame=ICRS(),
             specsys=specsys,
+            dtype=dtype,
             velocity_centre=velocity_centre,
         )
 
@@ -1,10 +1,23 @@
 import typing as T
+import numpy as np
 import astropy.units as U
 from astropy.wcs.wcs import WCS
 from astropy.coordinates.builtin_frames.baseradec import BaseRADecFrame
 
 HIfreq: U.Quantity[U.Hz]
 
+def _make_arcsec2_to_pix(
+    px_size: U.Quantity[U.arcsec],
+) -> T.Tuple[
+    U.UnitBase,
+    U.UnitBase,
+    T.Callable[[np.ndarray], np.ndarray],
+    T.Callable[[np.ndarray], np.ndarray],
+]: ...
+def _linear_pix2world(
+    pix: np.typing.ArrayLike, crpix: float, crval: float, cdelt: float
+) -> np.ndarray: ...
+
 class DataCube:
     px_size: U.Quantity[U.arcsec]
     arcsec2_to_pix: T.Tuple[
@@ -19,11 +32,8 @@ class DataCube:
     dec: U.Quantity[U.deg]
     padx: int
     pady: int
-    _array: (
-        U.Quantity[U.Jy * U.pix**-2]
-        | U.Quantity[U.Jy * U.arcsec**-2]
-        | U.Quantity[U.Jy * U.beam**-1]
-    )
+    _array: np.ndarray
+    _unit: U.UnitBase
     _wcs: T.Optional[WCS]
     n_px_x: int
     n_px_y: int
@@ -48,10 +58,24 @@ class DataCube:
         stokes_axis: bool = ...,
         coordinate_frame: BaseRADecFrame = ...,
         specsys: str = ...,
+        dtype: T.Type[np.floating] = ...,
         velocity_centre: None = ...,  # deprecated
     ) -> None: ...
     @classmethod
-    def from_wcs(cls, input_wcs: WCS, specsys=T.Optional[str]) -> T.Self: ...
+    def from_wcs(
+        cls,
+        input_wcs: WCS,
+        specsys=T.Optional[str],
+        dtype: T.Type[np.floating] = ...,
+    ) -> T.Self: ...
+    @property
+    def array(
+        self,
+    ) -> (
+        U.Quantity[U.Jy * U.pix**-2]
+        | U.Quantity[U.Jy * U.arcsec**-2]
+        | U.Quantity[U.Jy * U.beam**-1]
+    ): ...
     @property
     def units(
         self,
@@ -72,10 +96,14 @@ class DataCube:
     def freq_channels(self) -> None: ...  # deprecated
     @property
     def wcs(self) -> WCS: ...
+    def _spectral_pix2world(
+        self, pix: np.typing.ArrayLike, use_full_wcs: bool = ...
+    ) -> T.Union[U.Quantity[U.Hz], U.Quantity[U.m / U.s]]: ...
     @property
     def channel_mids(self) -> T.Union[U.Quantity[U.Hz], U.Quantity[U.m / U.s]]: ...
     @property
     def channel_edges(self) -> T.Union[U.Quantity[U.Hz], U.Quantity[U.m / U.s]]: ...
+    def _init_channels(self) -> None: ...
     @property
     def velocity_channel_mids(self) -> U.Quantity[U.m / U.s]: ...
     @property
@@ -92,6 +120,15 @@ class DataCube:
     def spatial_slices(self) -> T.Iterator[U.Quantity]: ...
     @property
     def spectra(self) -> T.Iterator[U.Quantity]: ...
+    @property
+    def spectra_batch(self) -> U.Quantity: ...
+    def _deposit(
+        self,
+        pixel_spectra: T.List[T.Tuple[T.Tuple[int, int], U.Quantity[U.Jy / U.pix**2]]],
+    ) -> None: ...
+    def _convert_unit(
+        self, unit: U.UnitBase, equivalencies: T.Optional[T.List] = ...
+    ) -> None: ...
     def add_pad(self, pad: T.Tuple[int, int]) -> None: ...
     def drop_pad(self) -> None: ...
     def copy(self) -> T.Self: ...
@@ -107,5 +144,6 @@ class _GlobalProfileDataCube(DataCube):
         channel_width: U.Quantity[U.arcsec] = ...,
         spectral_centre: U.Quantity[U.km / U.s] = ...,
         specsys: str = ...,
+        dtype: T.Type[np.floating] = ...,
         velocity_centre: None = ...,  # deprecated
     ) -> None: ...
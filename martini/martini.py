@@ -244,11 +244,9 @@ class _BaseMartini:
         Returns
         -------
         out : list
-            A list containing 2-tuples. Each 2-tuple contains and "insertion slice" that
-            is an index into the datacube._array instance held by this martini instance
-            where the pixel spectrum is to be placed, and a 1D array containing the
-            spectrum, whose length must match the length of the spectral axis of the
-            datacube.
+            A list containing 2-tuples. Each 2-tuple contains the indices (i, j) of a
+            pixel in the grid and a 1D array containing the spectrum in that pixel, whose
+            length must match the length of the spectral axis of the datacube.
         """
         result = list()
         rank, ij_pxs = ranks_and_ij_pxs
@@ -262,14 +260,9 @@ class _BaseMartini:
             weights = self.sph_kernel._px_weight(
                 self.source.pixcoords[:2, mask] - ij, mask=mask
             )
-            insertion_slice = (
-                np.s_[ij_px[0], ij_px[1], :, 0]
-                if self._datacube.stokes_axis
-                else np.s_[ij_px[0], ij_px[1], :]
-            )
             result.append(
                 (
-                    insertion_slice,
+                    ij_px,
                     (self.spectral_model.spectra[mask] * weights[..., np.newaxis]).sum(
                         axis=-2
                     ),
@@ -277,21 +270,6 @@ class _BaseMartini:
             )
         return result
 
-    def _insert_pixel(self, insertion_slice, insertion_data):
-        """
-        Insert the spectrum for a single pixel into the datacube array.
-
-        Parameters
-        ----------
-        insertion_slice : int, tuple or slice
-            Index into the datacube's _array specifying the insertion location.
-
-        insertion_data : ~numpy.typing.ArrayLike
-            1D array containing the spectrum at the location specified by insertion_slice.
-        """
-        self._datacube._array[insertion_slice] = insertion_data
-        return
-
     def _insert_source_in_cube(
         self, skip_validation=False, progressbar=None, ncpu=1, quiet=None
     ):
@@ -340,10 +318,9 @@ class _BaseMartini:
         )
 
         if ncpu == 1:
-            for insertion_slice, insertion_data in self._evaluate_pixel_spectrum(
-                (0, ij_pxs), progressbar=progressbar
-            ):
-                self._insert_pixel(insertion_slice, insertion_data)
+            self._datacube._deposit(
+                self._evaluate_pixel_spectrum((0, ij_pxs), progressbar=progressbar)
+            )
         else:
             # not multiprocessing, need serialization from dill not pickle
             from multiprocess import Pool
@@ -353,10 +330,9 @@ class _BaseMartini:
                     lambda x: self._evaluate_pixel_spectrum(x, progressbar=progressbar),
                     [(icpu, ij_pxs[icpu::ncpu]) for icpu in range(ncpu)],
                 ):
-                    for insertion_slice, insertion_data in result:
-                        self._insert_pixel(insertion_slice, insertion_data)
+                    self._datacube._deposit(result)
 
-        self._datacube._array = self._datacube._array.to(
+        self._datacube._convert_unit(
             U.Jy / U.arcsec**2, equivalencies=[self._datacube.arcsec2_to_pix]
         )
         pad_mask = (
@@ -369,14 +345,14 @@ class _BaseMartini:
             else np.s_[...]
         )
         inserted_flux_density = np.sum(
-            self._datacube._array[pad_mask] * self._datacube.px_size**2
+            self._datacube.array[pad_mask] * self._datacube.px_size**2
         ).to(U.Jy)
         inserted_mass = (
             2.36e5
             * U.Msun
             * self.source.distance.to_value(U.Mpc) ** 2
             * np.sum(
-                (self._datacube._array[pad_mask] * self._datacube.px_size**2)
+                (self._datacube.array[pad_mask] * self._datacube.px_size**2)
                 .sum((0, 1))
                 .squeeze()
                 .to_value(U.Jy)
@@ -394,9 +370,9 @@ class _BaseMartini:
                 f" {inserted_mass:.2e}",
                 f"    [{inserted_mass / self.source.input_mass * 100:.0f}%"
                 f" of initial source mass]",
-                f"  Maximum pixel: {self._datacube._array.max():.2e}",
+                f"  Maximum pixel: {self._datacube.array.max():.2e}",
                 "  Median non-zero pixel:"
-                f" {np.median(self._datacube._array[self._datacube._array > 0]):.2e}",
+                f" {np.median(self._datacube.array[self._datacube._array > 0]):.2e}",
                 sep="\n",
             )
         return
@@ -415,6 +391,7 @@ class _BaseMartini:
             ra=self._datacube.ra,
             dec=self._datacube.dec,
             stokes_axis=self._datacube.stokes_axis,
+            dtype=self._datacube._array.dtype,
         )
         self._datacube = DataCube(**init_kwargs)
         if self.beam is not None:
@@ -906,14 +883,14 @@ class Martini(_BaseMartini):
                 " by martini with a smaller beam?)"
             )
 
-        unit = self._datacube._array.unit
+        unit = self._datacube._unit
         for spatial_slice in self._datacube.spatial_slices:
             # use a view [...] to force in-place modification
             spatial_slice[...] = (
                 fftconvolve(spatial_slice, self.beam.kernel, mode="same") * unit
             )
         self._datacube.drop_pad()
-        self._datacube._array = self._datacube._array.to(
+        self._datacube._convert_unit(
             U.Jy * U.beam**-1,
             equivalencies=U.beam_angular_area(self.beam.area),
         )
@@ -921,10 +898,10 @@ class Martini(_BaseMartini):
             print(
                 "Beam convolved.",
                 "  Data cube RMS after beam convolution:"
-                f" {np.std(self._datacube._array):.2e}",
-                f"  Maximum pixel: {self._datacube._array.max():.2e}",
+                f" {np.std(self._datacube.array):.2e}",
+                f"  Maximum pixel: {self._datacube.array.max():.2e}",
                 "  Median non-zero pixel:"
-                f" {np.median(self._datacube._array[self._datacube._array > 0]):.2e}",
+                f" {np.median(self._datacube.array[self._datacube._array > 0]):.2e}",
                 sep="\n",
             )
         return
@@ -946,17 +923,17 @@ class Martini(_BaseMartini):
                 equivalencies=U.beam_angular_area(self.beam.area),
             )
             .to(
-                self._datacube._array.unit,
+                self._datacube._unit,
                 equivalencies=[self._datacube.arcsec2_to_pix],
             )
         )
-        self._datacube._array = self._datacube._array + noise_cube
+        self._datacube._array += noise_cube.to_value(self._datacube._unit)
         if not self.quiet:
             print(
                 "Noise added.",
                 f"  Noise cube RMS: {np.std(noise_cube):.2e} (before beam convolution).",
                 "  Data cube RMS after noise addition (before beam convolution): "
-                f"{np.std(self._datacube._array):.2e}",
+                f"{np.std(self._datacube.array):.2e}",
                 sep="\n",
             )
         return
@@ -1038,13 +1015,9 @@ class Martini(_BaseMartini):
         header.append(("INSTRUME", "MARTINI", martini_version))
         header.append(("BSCALE", 1.0))
         header.append(("BZERO", 0.0))
-        datacube_array_units = self._datacube._array.unit
-        header.append(
-            ("DATAMAX", np.max(self._datacube._array.to_value(datacube_array_units)))
-        )
-        header.append(
-            ("DATAMIN", np.min(self._datacube._array.to_value(datacube_array_units)))
-        )
+        datacube_array_units = self._datacube._unit
+        header.append(("DATAMAX", np.max(self._datacube._array)))
+        header.append(("DATAMIN", np.min(self._datacube._array)))
         header.append(("ORIGIN", "astropy v" + astropy_version))
         # long names break fits format, don't let the user set this
         if len(obj_name) > 16:
@@ -1067,9 +1040,7 @@ class Martini(_BaseMartini):
         header.append(("RESTFRQ", wcs_header["RESTFRQ"]))
 
         # flip axes to write
-        hdu = fits.PrimaryHDU(
-            header=header, data=self._datacube._array.to_value(datacube_array_units).T
-        )
+        hdu = fits.PrimaryHDU(header=header, data=self._datacube._array.T)
         hdu.writeto(filename, overwrite=overwrite)
 
         return
@@ -1229,11 +1200,11 @@ class Martini(_BaseMartini):
         driver = "core" if memmap else None
         h5_kwargs = {"backing_store": False} if memmap else dict()
         f = h5py.File(filename, mode, driver=driver, **h5_kwargs)
-        datacube_array_units = self._datacube._array.unit
-        f["FluxCube"] = self._datacube._array.to_value(datacube_array_units).squeeze()
+        f["FluxCube"] = self._datacube._array.squeeze()
         c = f["FluxCube"]
         origin = 0  # index from 0 like numpy, not from 1
         if not compact:
+            n_axes = 4 if self._datacube.stokes_axis else 3
             # voxel centre coordinates:
             xgrid, ygrid, vgrid = np.meshgrid(
                 np.arange(self._datacube._array.shape[0]),
@@ -1241,24 +1212,11 @@ class Martini(_BaseMartini):
                 np.arange(self._datacube._array.shape[2]),
                 indexing="ij",
             )
-            cgrid = (
-                np.vstack(
-                    (
-                        xgrid.flatten(),
-                        ygrid.flatten(),
-                        vgrid.flatten(),
-                        np.zeros(vgrid.shape).flatten(),
-                    )
-                ).T
-                if self._datacube.stokes_axis
-                else np.vstack(
-                    (
-                        xgrid.flatten(),
-                        ygrid.flatten(),
-                        vgrid.flatten(),
-                    )
-                ).T
-            )
+            # Stokes pixel coordinate (if any) stays at the initial 0:
+            cgrid = np.zeros((vgrid.size, n_axes))
+            cgrid[:, 0] = xgrid.ravel()
+            cgrid[:, 1] = ygrid.ravel()
+            cgrid[:, 2] = vgrid.ravel()
             wgrid = self._datacube.wcs.all_pix2world(cgrid, origin)
             grid_shape = (
                 self.datacube.n_px_x,
@@ -1281,24 +1239,10 @@ class Martini(_BaseMartini):
                 np.arange(self._datacube._array.shape[2] + 1) - 0.5,
                 indexing="ij",
             )
-            cgrid_vertices = (
-                np.vstack(
-                    (
-                        xgrid_vertices.flatten(),
-                        ygrid_vertices.flatten(),
-                        vgrid_vertices.flatten(),
-                        np.zeros(vgrid_vertices.shape).flatten(),
-                    )
-                ).T
-                if self._datacube.stokes_axis
-                else np.vstack(
-                    (
-                        xgrid_vertices.flatten(),
-                        ygrid_vertices.flatten(),
-                        vgrid_vertices.flatten(),
-                    )
-                ).T
-            )
+            cgrid_vertices = np.zeros((vgrid_vertices.size, n_axes))
+            cgrid_vertices[:, 0] = xgrid_vertices.ravel()
+            cgrid_vertices[:, 1] = ygrid_vertices.ravel()
+            cgrid_vertices[:, 2] = vgrid_vertices.ravel()
             wgrid_vertices = self._datacube.wcs.all_pix2world(cgrid_vertices, origin)
             vertices_grid_shape = (
                 self.datacube.n_px_x + 1,
@@ -1326,7 +1270,7 @@ class Martini(_BaseMartini):
                     getattr(self._datacube, dataset_name).unit
                 )
         c.attrs["AxisOrder"] = "(RA,Dec,Channels)"
-        c.attrs["FluxCubeUnit"] = str(self._datacube._array.unit)
+        c.attrs["FluxCubeUnit"] = str(self._datacube._unit)
         c.attrs["deltaRA_in_RAUnit"] = wcs_header["CDELT1"]
         c.attrs["RA0_in_px"] = wcs_header["CRPIX1"] - 1
         c.attrs["RA0_in_RAUnit"] = wcs_header["CRVAL1"]
@@ -1591,7 +1535,7 @@ class GlobalProfile(_BaseMartini):
         # across the entire pixel is incorrect. Correctly integrate out spatial
         # information and convert to Jy:
         self._spectrum = (
-            (self._datacube._array.squeeze()).to(
+            (self._datacube.array.squeeze()).to(
                 U.Jy / U.pix**2, equivalencies=[self._datacube.arcsec2_to_pix]
             )
             * U.pix**2
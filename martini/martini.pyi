@@ -1,4 +1,3 @@
-from numpy import ndarray
 import typing as T
 from martini.beams import _BaseBeam
 from martini.datacube import DataCube as DataCube
@@ -43,10 +42,7 @@ class _BaseMartini:
         self,
         ranks_and_ij_pxs: T.Tuple[int, T.List[T.Tuple[int, int]]],
         progressbar: bool = ...,
-    ) -> T.Tuple[slice, U.Quantity[U.Jy / U.arcsec**2]]: ...
-    def _insert_pixel(
-        self, insertion_slice: T.Union[int, T.Tuple, slice], insertion_data: ndarray
-    ) -> None: ...
+    ) -> T.List[T.Tuple[T.Tuple[int, int], U.Quantity[U.Jy / U.pix**2]]]: ...
     def _insert_source_in_cube(
         self,
         skip_validation: bool = ...,
@@ -88,7 +88,7 @@ def L_align(xyz, vxyz, m, frac=0.3, saverot=None, Laxis="z"):
     xhat = xhat / np.sqrt(np.sum(np.power(xhat, 2)))  # normalized
     yhat = np.cross(zhat, xhat)  # guarantees right-handedness
 
-    rotmat = np.vstack((xhat, yhat, zhat)).to(U.dimensionless_unscaled).value
+    rotmat = np.vstack((xhat, yhat, zhat)).to_value(U.dimensionless_unscaled)
     if Laxis == "z":
         pass
     elif Laxis == "y":
@@ -178,8 +178,8 @@ class EAGLESource(SPHSource):
 
         with h5py.File(snapFile, "r") as f:
             h = f["RuntimePars"].attrs["HubbleParam"]
-            subBoxSize = (subBoxSize * h / a).to(U.Mpc).value
-            centre = (cop * h / a).to(U.Mpc).value
+            subBoxSize = (subBoxSize * h / a).to_value(U.Mpc)
+            centre = (cop * h / a).to_value(U.Mpc)
             eagle_data = EagleSnapshot(snapFile)
             region = np.vstack((centre - subBoxSize, centre + subBoxSize)).T.flatten()
             eagle_data.select_region(*region)
@@ -280,9 +280,7 @@ def dc_random(request):
         stokes_axis=stokes_axis,
     )
 
-    dc._array[...] = (
-        np.random.rand(dc._array.size).reshape(dc._array.shape) * dc._array.unit
-    )
+    dc._array[...] = np.random.rand(dc._array.size).reshape(dc._array.shape)
 
     yield dc
 
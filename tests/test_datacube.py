@@ -1,10 +1,13 @@
 import pytest
 import os
+import gc
+import weakref
 import numpy as np
 from astropy import wcs
 from astropy import units as U
+from astropy.coordinates import SpectralCoord
 from martini import DataCube
-from martini.datacube import HIfreq
+from martini.datacube import HIfreq, _GlobalProfileDataCube
 
 
 def check_wcs_match(wcs1, wcs2):
@@ -24,6 +27,8 @@ class TestDeprecationWarnings:
             dc.velocity_channels()
         with pytest.warns(DeprecationWarning):
             dc.freq_channels()
+        with pytest.warns(DeprecationWarning):
+            dc.spectra
 
 
 class TestDataCube:
@@ -49,6 +54,59 @@ class TestDataCube:
         expected_shape = (10, 11, 12, 1) if datacube.stokes_axis else (10, 11, 12)
         assert datacube._array.shape == expected_shape
 
+    def test_dtype(self):
+        """
+        Check that the requested dtype is used and kept as the cube is manipulated.
+        """
+        datacube = DataCube(n_px_x=10, n_px_y=11, n_channels=12, dtype=np.float32)
+        assert datacube._array.dtype == np.float32
+        datacube.add_pad((2, 2))
+        datacube._convert_unit(
+            U.Jy * U.arcsec**-2, equivalencies=[datacube.arcsec2_to_pix]
+        )
+        datacube.drop_pad()
+        assert datacube._array.dtype == np.float32
+        assert datacube.copy()._array.dtype == np.float32
+
+    def test_global_profile_dtype(self):
+        """
+        Check that the single-pixel global profile datacube accepts a dtype.
+        """
+        datacube = _GlobalProfileDataCube(n_channels=12, dtype=np.float32)
+        assert datacube._array.dtype == np.float32
+
+    @pytest.mark.parametrize("dtype", (np.int16, np.float16, np.longdouble))
+    def test_invalid_dtype(self, dtype):
+        """
+        Check that we get an error for a dtype other than float32 or float64.
+        """
+        with pytest.raises(ValueError, match="must be numpy.float32 or numpy.float64"):
+            DataCube(dtype=dtype)
+
+    def test_array_is_unit_view(self, dc_random):
+        """
+        Check that the array property attaches units without copying the data.
+        """
+        assert isinstance(dc_random._array, np.ndarray)
+        assert not isinstance(dc_random._array, U.Quantity)
+        assert dc_random.array.unit == dc_random._unit
+        assert np.shares_memory(dc_random.array, dc_random._array)
+
+    def test_lazy_initialization(self):
+        """
+        Check that the WCS and channels are only computed when first needed.
+        """
+        datacube = DataCube()
+        assert datacube._wcs is None
+        assert datacube._channel_mids is None
+        assert datacube._channel_edges is None
+        datacube.channel_mids
+        assert datacube._wcs is not None
+        assert datacube._channel_mids is not None
+        assert datacube._channel_edges is not None  # computed together with the mids
+        channel_mids = datacube.channel_mids
+        assert datacube.channel_mids is channel_mids  # cached, not recomputed
+
     def test_channel_mids(self, dc_zeros):
         """
         Check that first and last channel mids are spaced as expected.
@@ -63,13 +121,91 @@ class TestDataCube:
         bandwidth = np.abs(dc_zeros.channel_edges[-1] - dc_zeros.channel_edges[0])
         assert bandwidth == dc_zeros.n_channels * dc_zeros.channel_width
 
+    def test_channel_mids_between_edges(self, dc_zeros):
+        """
+        Check that each channel centre lies halfway between its edges.
+        """
+        assert dc_zeros.channel_edges.size == dc_zeros.channel_mids.size + 1
+        assert U.allclose(
+            dc_zeros.channel_mids,
+            0.5 * (dc_zeros.channel_edges[:-1] + dc_zeros.channel_edges[1:]),
+        )
+
+    def test_linear_spectral_axis_matches_wcs(self, dc_zeros):
+        """
+        Check that the linear spectral axis shortcut agrees with the full WCS.
+        """
+        pix = np.arange(dc_zeros.n_channels + 1) - 0.5
+        assert U.allclose(
+            dc_zeros._spectral_pix2world(pix),
+            dc_zeros._spectral_pix2world(pix, use_full_wcs=True),
+        )
+
+    @pytest.mark.parametrize("use_full_wcs", (False, True))
+    def test_single_pixel_spectral_axis_is_1d(self, dc_zeros, use_full_wcs):
+        """
+        Check that both spectral axis evaluations give 1D results for a single pixel.
+        """
+        for pix in (0, [0]):
+            world = dc_zeros._spectral_pix2world(pix, use_full_wcs=use_full_wcs)
+            assert world.shape == (1,)
+
+    def test_single_channel(self):
+        """
+        Check that a single channel datacube has 1D channel mids and edges.
+        """
+        datacube = DataCube(n_px_x=4, n_px_y=4, n_channels=1)
+        assert datacube.channel_mids.shape == (1,)
+        assert datacube.channel_edges.shape == (2,)
+
     def test_iterators(self, dc_zeros):
         """
         Check that iterators over slices give us expected lengths.
         """
         assert len(list(dc_zeros.channel_maps)) == dc_zeros.n_channels
         assert len(list(dc_zeros.spatial_slices)) == dc_zeros.n_channels
-        assert len(list(dc_zeros.spectra)) == dc_zeros.n_px_x * dc_zeros.n_px_y
+        with pytest.warns(DeprecationWarning):
+            assert len(list(dc_zeros.spectra)) == dc_zeros.n_px_x * dc_zeros.n_px_y
+
+    def test_spectra_batch(self, dc_random):
+        """
+        Check that the spectra batch has one row per spatial pixel.
+        """
+        spectra = dc_random.spectra_batch
+        n_px = dc_random.n_px_x * dc_random.n_px_y
+        assert spectra.shape == (n_px, dc_random.n_channels)
+        assert U.allclose(spectra[dc_random.n_px_y], dc_random.array[1, 0, :].squeeze())
+
+    def test_spectra_are_contiguous_views(self, dc_random):
+        """
+        Check that spectra and spatial slices are views into the cube, not copies.
+        """
+        spectra = dc_random.spectra_batch
+        assert spectra.flags["C_CONTIGUOUS"]
+        assert np.shares_memory(spectra, dc_random._array)
+        assert np.shares_memory(next(dc_random.spatial_slices), dc_random._array)
+
+    def test_deposit(self, dc_zeros):
+        """
+        Check that a batch of pixel spectra lands in the expected pixels.
+        """
+        spectrum = np.arange(dc_zeros.n_channels) * U.mJy * U.pix**-2
+        dc_zeros._deposit([((0, 1), spectrum), ((2, 3), 2 * spectrum)])
+        assert U.allclose(dc_zeros.array[0, 1].squeeze(), spectrum)
+        assert U.allclose(dc_zeros.array[2, 3].squeeze(), 2 * spectrum)
+        assert np.count_nonzero(dc_zeros._array.sum(axis=2)) == 2
+
+    def test_deposit_in_chunks(self, dc_zeros, monkeypatch):
+        """
+        Check that deposition split over several chunks writes every pixel.
+        """
+        monkeypatch.setattr("martini.datacube._DEPOSIT_CHUNK_SIZE", 3)
+        spectrum = np.ones(dc_zeros.n_channels) * U.Jy * U.pix**-2
+        pixel_spectra = [((i, i), (i + 1) * spectrum) for i in range(7)]
+        dc_zeros._deposit(pixel_spectra)
+        for ij_px, pixel_spectrum in pixel_spectra:
+            assert U.allclose(dc_zeros.array[ij_px].squeeze(), pixel_spectrum)
+        assert np.count_nonzero(dc_zeros._array.sum(axis=2)) == len(pixel_spectra)
 
     def test_freq_channels(self, dc_zeros):
         """
@@ -119,6 +255,24 @@ class TestDataCube:
             dc_zeros.velocity_channel_edges,
         )
 
+    @pytest.mark.parametrize(
+        "attr",
+        (
+            "velocity_channel_mids",
+            "velocity_channel_edges",
+            "frequency_channel_mids",
+            "frequency_channel_edges",
+        ),
+    )
+    def test_channels_are_spectral_coords(self, dc_zeros, attr):
+        """
+        Check that channels in velocity or frequency units keep their doppler info.
+        """
+        channels = getattr(dc_zeros, attr)
+        assert isinstance(channels, SpectralCoord)
+        assert channels.doppler_convention == "radio"
+        assert channels.doppler_rest == HIfreq
+
     def test_add_pad(self, dc_zeros):
         """
         Check that adding pad gives desired shape.
@@ -137,6 +291,17 @@ class TestDataCube:
         assert dc_zeros.padx == pad[0]
         assert dc_zeros.pady == pad[1]
 
+    def test_add_pad_preserves_data(self, dc_random):
+        """
+        Check that adding pad keeps the data in place and fills the pad with zeros.
+        """
+        initial_array = dc_random._array.copy()
+        pad = (2, 3)
+        dc_random.add_pad(pad)
+        inner = np.s_[pad[0] : -pad[0], pad[1] : -pad[1]]
+        assert np.all(dc_random._array[inner] == initial_array)
+        assert np.isclose(dc_random._array.sum(), initial_array.sum())
+
     def test_add_pad_already_padded(self, dc_zeros):
         """
         Check that we can't double-pad.
@@ -164,6 +329,7 @@ class TestDataCube:
             expected_shape = expected_shape + (old_shape[3],)
         assert dc_zeros._array.shape == initial_shape
         assert dc_zeros._array.shape == expected_shape
+        assert dc_zeros._array.flags["C_CONTIGUOUS"]
         assert dc_zeros.padx == 0
         assert dc_zeros.pady == 0
 
@@ -208,13 +374,37 @@ class TestDataCube:
         for attr in (
             "_channel_edges",
             "_channel_mids",
-            "_array",
+            "array",
         ):
             if getattr(dc_random, attr) is not None:
                 assert U.allclose(getattr(dc_random, attr), getattr(copy, attr))
             else:
                 assert getattr(copy, attr) is None
         check_wcs_match(dc_random.wcs, copy.wcs)
+        assert copy.stokes_axis == dc_random.stokes_axis
+        assert copy.specsys == dc_random.specsys
+        # copy must not share mutable state with the original
+        assert not np.shares_memory(copy._array, dc_random._array)
+        assert copy.wcs is not dc_random.wcs
+        copy.wcs.wcs.crpix[0] += 1
+        assert copy.wcs.wcs.crpix[0] != dc_random.wcs.wcs.crpix[0]
+
+    def test_copy_releases_original(self):
+        """
+        Check that a copy holds no references that keep the original datacube alive.
+        """
+        datacube = DataCube(n_px_x=10, n_px_y=11, n_channels=12)
+        copy = datacube.copy()
+        original = weakref.ref(datacube)
+        del datacube
+        gc.collect()
+        assert original() is None
+        assert U.isclose(
+            (1 * U.Jy * U.pix**-2).to(
+                U.Jy * U.arcsec**-2, equivalencies=[copy.arcsec2_to_pix]
+            ),
+            1 * U.Jy * U.arcsec**-2 / copy.px_size.to_value(U.arcsec) ** 2,
+        )
 
     @pytest.mark.parametrize("with_pad", (False, True))
     def test_save_and_load_state(self, dc_random, with_pad):
@@ -250,9 +440,10 @@ class TestDataCube:
             for attr in (
                 "channel_edges",
                 "channel_mids",
-                "_array",
+                "array",
             ):
                 assert U.allclose(getattr(dc_random, attr), getattr(loaded, attr))
+            assert loaded._array.dtype == dc_random._array.dtype
             check_wcs_match(dc_random.wcs, loaded.wcs)
         except Exception:
             raise
@@ -369,6 +560,13 @@ class TestDataCubeFromWCS:
         from_wcs = DataCube.from_wcs(dc_random.wcs)
         assert from_wcs.specsys == "icrs"
 
+    def test_dtype(self, dc_random):
+        """
+        Check that the requested dtype is passed through to the new datacube.
+        """
+        from_wcs = DataCube.from_wcs(dc_random.wcs, dtype=np.float32)
+        assert from_wcs._array.dtype == np.float32
+
     def test_unrecognized_specsys(self, dc_random):
         """
         Check that we get an error for a specsys that we can't understand.
@@ -21,7 +21,7 @@ def check_mass_accuracy(m, out_mode):
         )
 
     # flux in channels
-    F = (m.datacube._array * m.datacube.px_size**2).sum((0, 1)).squeeze()  # Jy
+    F = (m.datacube.array * m.datacube.px_size**2).sum((0, 1)).squeeze()  # Jy
 
     # distance
     D = m.source.distance
@@ -44,7 +44,7 @@ def check_mass_accuracy(m, out_mode):
     m.convolve_beam()
 
     # radiant intensity
-    Irad = m.datacube._array.sum((0, 1)).squeeze()  # Jy / beam
+    Irad = m.datacube.array.sum((0, 1)).squeeze()  # Jy / beam
 
     # beam area, for an equivalent Gaussian beam
     A = np.pi * m.beam.bmaj * m.beam.bmin / 4 / np.log(2) / U.beam
@@ -239,7 +239,7 @@ class TestMartini:
             spectral_model=spectral_model,
         )
         m.insert_source_in_cube()
-        unconvolved_cube = m.datacube._array.copy()
+        unconvolved_cube = m.datacube.array.copy()
         unit = unconvolved_cube.unit
         s = np.s_[..., 0] if m.datacube.stokes_axis else np.s_[...]
         for spatial_slice in iter(unconvolved_cube[s].transpose((2, 0, 1))):
@@ -254,24 +254,24 @@ class TestMartini:
             equivalencies=U.beam_angular_area(m.beam.area),
         )
         m.convolve_beam()
-        assert U.allclose(m.datacube._array, convolved_cube)
+        assert U.allclose(m.datacube.array, convolved_cube)
 
     def test_add_noise(self, m_init):
         """
         Check that noise provided goes into the datacube when we call add_noise.
         """
-        assert (m_init.datacube._array.sum() == 0).all()
+        assert (m_init.datacube.array.sum() == 0).all()
         assert m_init.noise.seed is not None
         expected_noise = m_init.noise.generate(m_init.datacube, m_init.beam)
         m_init.noise.reset_rng()
         m_init.add_noise()
         assert U.allclose(
-            m_init.datacube._array,
+            m_init.datacube.array,
             expected_noise.to(
                 U.Jy * U.arcsec**-2,
                 equivalencies=U.beam_angular_area(m_init.beam.area),
             ).to(
-                m_init.datacube._array.unit,
+                m_init.datacube.array.unit,
                 equivalencies=[m_init.datacube.arcsec2_to_pix],
             ),
         )
@@ -393,14 +393,14 @@ class TestMartini:
         """
         Check that resetting martini instance zeros out datacube.
         """
-        cube_array = m_nn.datacube._array
-        assert m_nn.datacube._array.sum() > 0
+        cube_array = m_nn.datacube.array
+        assert m_nn.datacube.array.sum() > 0
         m_nn.reset()
-        assert m_nn.datacube._array.sum() == 0
+        assert m_nn.datacube.array.sum() == 0
         # check that can start over and get the same result w/o errors
         m_nn.insert_source_in_cube(progressbar=False)
         m_nn.convolve_beam()
-        assert U.allclose(cube_array, m_nn.datacube._array)
+        assert U.allclose(cube_array, m_nn.datacube.array)
         # check that can reset after doing nothing
         m_nn.reset()
         m_nn.reset()
@@ -414,9 +414,33 @@ class TestMartini:
             spectral_model=DiracDeltaSpectrum(),
             sph_kernel=DiracDeltaKernel(),
         )
-        expected_shape = m.datacube._array.shape
+        expected_shape = m.datacube.array.shape
         m.reset()
-        assert m.datacube._array.shape == expected_shape
+        assert m.datacube.array.shape == expected_shape
+
+    def test_reset_preserves_dtype(self, single_particle_source):
+        """
+        Check that a single precision datacube stays single precision after reset.
+        """
+        m = Martini(
+            source=single_particle_source(),
+            datacube=DataCube(
+                n_px_x=16,
+                n_px_y=16,
+                n_channels=16,
+                spectral_centre=3 * 70 * U.km / U.s,
+                dtype=np.float32,
+            ),
+            beam=GaussianBeam(),
+            noise=None,
+            spectral_model=DiracDeltaSpectrum(),
+            sph_kernel=DiracDeltaKernel(),
+        )
+        m.insert_source_in_cube(skip_validation=True, progressbar=False)
+        m.convolve_beam()
+        assert m.datacube._array.dtype == np.float32
+        m.reset()
+        assert m.datacube._array.dtype == np.float32
 
     def test_preview(self, m_init):
         """
@@ -468,7 +492,7 @@ class TestMartini:
 
         def centre_pixels_slice(m):
             datacube = m.datacube
-            return m.datacube._array[
+            return m.datacube.array[
                 datacube.n_px_x // 2
                 - 1
                 + datacube.padx : datacube.n_px_x // 2
@@ -540,7 +564,7 @@ class TestMartini:
 
         def centre_channels_slice(m):
             datacube = m.datacube
-            return m.datacube._array[
+            return m.datacube.array[
                 :, :, datacube.n_channels // 2 - 1 : datacube.n_channels // 2 + 1
             ]
 
@@ -604,9 +628,9 @@ class TestMartini:
                 ra_idx, dec_idx, spec_idx = m.datacube.wcs.all_world2pix(
                     voxel_coords, origin
                 ).T
-                ra_idx = ra_idx.reshape((m.datacube._array.shape))
-                dec_idx = dec_idx.reshape((m.datacube._array.shape))
-                spec_idx = spec_idx.reshape((m.datacube._array.shape))
+                ra_idx = ra_idx.reshape((m.datacube.array.shape))
+                dec_idx = dec_idx.reshape((m.datacube.array.shape))
+                spec_idx = spec_idx.reshape((m.datacube.array.shape))
                 expected_idx = np.meshgrid(
                     np.arange(m.datacube.n_px_x),
                     np.arange(m.datacube.n_px_y),
@@ -635,7 +659,7 @@ class TestMartini:
                 ra_vx_idx, dec_vx_idx, spec_vx_idx = m.datacube.wcs.all_world2pix(
                     vertex_coords, origin
                 ).T
-                shape = [s + 1 for s in m.datacube._array.shape]
+                shape = [s + 1 for s in m.datacube.array.shape]
                 ra_vx_idx = ra_vx_idx.reshape(shape)
                 dec_vx_idx = dec_vx_idx.reshape(shape)
                 spec_vx_idx = spec_vx_idx.reshape(shape)
@@ -674,22 +698,22 @@ class TestParallel:
         )
 
         m.insert_source_in_cube(ncpu=1, progressbar=False)
-        expected_result = m.datacube._array
+        expected_result = m.datacube.array
 
         # check that we're not testing on a zero array
-        assert m.datacube._array.sum() > 0
+        assert m.datacube.array.sum() > 0
 
         m.reset()
 
         # check the reset was successful
         assert np.allclose(
-            m.datacube._array.to_value(m.datacube._array.unit),
+            m.datacube.array.to_value(m.datacube.array.unit),
             0.0,
         )
 
         m.insert_source_in_cube(ncpu=2, progressbar=False)
 
-        assert U.allclose(m.datacube._array, expected_result)
+        assert U.allclose(m.datacube.array, expected_result)
 
 
 class TestGlobalProfile:
@@ -802,16 +826,16 @@ class TestGlobalProfile:
         """
         Check that resetting global profile instance zeros out datacube and spectrum.
         """
-        cube_array = gp._datacube._array
-        assert gp._datacube._array.sum() > 0
+        cube_array = gp._datacube.array
+        assert gp._datacube.array.sum() > 0
         spectrum = gp.spectrum
         assert spectrum.sum() > 0
         gp.reset()
-        assert gp._datacube._array.sum() == 0
+        assert gp._datacube.array.sum() == 0
         assert not hasattr(gp, "_spectrum")
         # check that can start over and get the same result w/o errors
         gp.insert_source_in_spectrum()
-        assert U.allclose(cube_array, gp._datacube._array)
+        assert U.allclose(cube_array, gp._datacube.array)
         assert U.allclose(spectrum, gp.spectrum)
         # check that can reset after doing nothing
         gp.reset()
@@ -15,7 +15,7 @@ class TestNoise:
         datacube = DataCube(n_px_x=256, n_px_y=256, n_channels=64)
         beam = GaussianBeam()
         noise = noise_generator.generate(datacube, beam)
-        assert noise.shape == datacube._array.shape
+        assert noise.shape == datacube.array.shape
 
     def test_noise_amplitude(self, m_init):
         """
@@ -23,10 +23,10 @@ class TestNoise:
         """
         target_rms = m_init.noise.target_rms
         m_init.insert_source_in_cube(progressbar=False)
-        m_init.datacube._array[...] = 0 * U.Jy * U.arcsec**-2
+        m_init.datacube.array[...] = 0 * U.Jy * U.arcsec**-2
         m_init.add_noise()
         m_init.convolve_beam()
-        measured_rms = np.sqrt(np.mean(np.power(m_init.datacube._array, 2)))
+        measured_rms = np.sqrt(np.mean(np.power(m_init.datacube.array, 2)))
         assert U.isclose(measured_rms, target_rms, rtol=0.1)
 
     def test_noise_seed(self):
@@ -20,8 +20,9 @@ class TestSourceUtilities:
         _xyz = np.array([[1, 0, 0], [0, 1, 0], [-1, 0, 0], [0, -1, 0]])
         _vxyz = np.array([[0, 1, 0], [-1, 0, 0], [0, -1, 0], [1, 0, 0]])
         # tile outwards to make a 4-armed "windmill"
-        xyz = np.vstack((_xyz * np.arange(1, 201).reshape(200, 1, 1))) * U.kpc
-        vxyz = np.vstack((_vxyz * np.arange(1, 201).reshape(200, 1, 1))) * U.km / U.s
+        scale = np.arange(1, 201)[:, np.newaxis, np.newaxis]
+        xyz = (_xyz[np.newaxis] * scale).reshape(-1, 3) * U.kpc
+        vxyz = (_vxyz[np.newaxis] * scale).reshape(-1, 3) * U.km / U.s
         m = np.ones(xyz.shape[0]) * U.Msun
         # rotating zhat to align with zhat should stay aligned with zhat
         # (but might arbitrarily rotate x-y plane)